@@ -17,24 +17,255 @@ __license__ = "MIT"
 
 import asyncio
 from bleak import BleakScanner, BleakClient
+import re
 import sys
 import time
 from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from functools import lru_cache
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from itertools import islice
+from reportlab.lib.pagesizes import letter, A4, landscape
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, TableStyle, PageBreak, LongTable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 import os
 
-async def scan_bluetooth_devices(duration=10):
+# Standard Bluetooth service UUIDs
+_SERVICE_NAMES = {
+    "0000180f-0000-1000-8000-00805f9b34fb": "Battery Service",
+    "0000180a-0000-1000-8000-00805f9b34fb": "Device Information",
+    "0000181c-0000-1000-8000-00805f9b34fb": "User Data",
+    "0000180d-0000-1000-8000-00805f9b34fb": "Heart Rate",
+    "0000181a-0000-1000-8000-00805f9b34fb": "Environmental Sensing",
+    "0000110a-0000-1000-8000-00805f9b34fb": "Audio Source",
+    "0000110b-0000-1000-8000-00805f9b34fb": "Audio Sink",
+    "0000111e-0000-1000-8000-00805f9b34fb": "Hands-Free",
+    "6e400001-b5a3-f393-e0a9-e50e24dcca9e": "Nordic UART Service"
+}
+
+# Secondary lookup keyed on the 8-character short UUID prefix, built once at
+# import so the fallback in get_service_name is a dict hit instead of a scan
+_SERVICE_NAMES_BY_SHORT = {full[:8]: name for full, name in _SERVICE_NAMES.items()}
+
+# Usuwa separatory adresu MAC w jednym przebiegu str.translate
+_MAC_STRIP = str.maketrans('', '', ':-')
+
+# Słownik popularnych OUI i producentów
+_OUI_MANUFACTURERS = {
+    '000000': 'Xerox',
+    '0001C8': 'Hewlett Packard',
+    '000C29': 'VMware',
+    '001B63': 'Apple',
+    '00A040': 'Apple',
+    '28E02C': 'Apple',
+    '2C5490': 'Apple',
+    '3CAB8E': 'Apple',
+    '4025C2': 'Apple',
+    '509EA7': 'Apple',
+    '68AB1E': 'Apple',
+    '6C2483': 'Apple',
+    '7CFA4E': 'Apple',
+    '84F3EB': 'Apple',
+    '8C2937': 'Apple',
+    '90B21F': 'Apple',
+    'A4C361': 'Apple',
+    'B8E856': 'Apple',
+    'C82A14': 'Apple',
+    'D023DB': 'Apple',
+    'E4C63D': 'Apple',
+    'E8802E': 'Apple',
+    'EC8892': 'Apple',
+    'F01C13': 'Apple',
+    'F40E22': 'Apple',
+    '0050F2': 'Microsoft',
+    '00155D': 'Microsoft',
+    '001DD8': 'Microsoft',
+    '0017FA': 'Microsoft',
+    '7C1E52': 'Microsoft',
+    '000272': 'Intel',
+    '001B77': 'Intel',
+    '0050F2': 'Intel',
+    '24F5AA': 'Intel',
+    '34E6AD': 'Intel',
+    '7085C2': 'Intel',
+    '001377': 'Samsung',
+    '002454': 'Samsung',
+    '00374A': 'Samsung',
+    '003EE1': 'Samsung',
+    '74DA38': 'Samsung',
+    '8C77121': 'Samsung',
+    'C869CD': 'Samsung',
+    'E84E06': 'Samsung',
+    'F09FC2': 'Samsung',
+    '000F86': 'Huawei',
+    '001E10': 'Huawei',
+    '003048': 'Huawei',
+    '00664C': 'Huawei',
+    '001CF0': 'LG Electronics',
+    '001E75': 'LG Electronics',
+    '002140': 'LG Electronics',
+    '0021D1': 'LG Electronics',
+    '00E04C': 'Realtek',
+    '52540E': 'Realtek',
+    '9CEB2E': 'Realtek',
+    'B0359E': 'Realtek'
+}
+
+# Per-category precompiled patterns over the lowered device name, ordered by
+# classification priority: the first pattern that matches wins, exactly like
+# the original if/elif ladder of substring checks
+_DEVICE_TYPE_PATTERNS = (
+    (re.compile(r'airpods|headphones|earbuds|speaker|audio'), "🎧 Audio Device"),
+    (re.compile(r'iphone|samsung|phone|mobile'), "📱 Mobile Phone"),
+    (re.compile(r'watch|band|fitness'), "⌚ Wearable Device"),
+    (re.compile(r'mouse|keyboard|trackpad'), "🖱️ Input Device"),
+    (re.compile(r'tv|display|monitor'), "📺 Display Device"),
+    (re.compile(r'sensor|thermometer|humidity'), "🌡️ Sensor"),
+    (re.compile(r'light|bulb|lamp'), "💡 Smart Light"),
+)
+
+# Service-based and fallback classifications as shared constants; emoji code
+# points keep these strings out of CPython's small-literal interning, so
+# returning the module-level objects avoids fresh allocations per device
+_TYPE_HEART_RATE = "❤️ Heart Rate Monitor"
+_TYPE_BATTERY = "🔋 Battery Device"
+_TYPE_AUDIO_SERVICE = "🎵 Audio Device"
+_TYPE_BLE_DEFAULT = "🔵 Bluetooth Low Energy Device"
+
+# Precomputed PDF cell variants (truncated to fit the Device Type column),
+# so the per-row length check and slicing disappear from the table loop
+_TYPE_PDF_CELLS = {
+    label: label if len(label) <= 18 else label[:15] + "..."
+    for label in (*(label for _, label in _DEVICE_TYPE_PATTERNS),
+                  _TYPE_HEART_RATE, _TYPE_BATTERY,
+                  _TYPE_AUDIO_SERVICE, _TYPE_BLE_DEFAULT)
+}
+
+# RSSI bucket thresholds shared by the console description and the PDF signal
+# column; bisect maps a reading into its bucket with one C-level search
+_RSSI_THRESHOLDS = [-90, -70, -50, -30]
+_RSSI_DESCRIPTIONS = ("Very Weak 📵", "Weak 📶", "Medium 📶📶",
+                      "Strong 📶📶📶", "Very Strong 📶📶📶📶")
+_RSSI_TABLE_LABELS = ("📵 Very Weak", "📶 Weak", "📶📶 Medium",
+                      "📶📶📶 Strong", "📶📶📶 Strong")
+
+# Per-device PDF row cache keyed on the advertisement fingerprint, so devices
+# whose data is unchanged between report runs skip all name resolution and
+# string formatting; bounded LRU to keep long-running monitors in check
+_ROW_CACHE = OrderedDict()
+_ROW_CACHE_MAX = 4096
+
+# Lowered service names used for the service-UUID based classification
+_HEART_RATE_SERVICES = {'heart rate'}
+_BATTERY_SERVICES = {'battery service'}
+_AUDIO_SERVICES = {'audio source', 'audio sink'}
+
+_COMPANY_NAMES = {
+    0: 'Ericsson Technology Licensing',
+    1: 'Nokia Mobile Phones',
+    2: 'Intel Corp.',
+    3: 'IBM Corp.',
+    4: 'Toshiba Corp.',
+    5: '3Com',
+    6: 'Microsoft',
+    7: 'Lucent',
+    8: 'Motorola',
+    9: 'Infineon Technologies AG',
+    10: 'Qualcomm Technologies International, Ltd.',
+    15: 'Broadcom Corporation',
+    29: 'Texas Instruments Inc.',
+    48: 'Hewlett-Packard Company',
+    57: 'AVM Berlin',
+    69: 'Aruba Networks',
+    76: 'Apple, Inc.',
+    89: 'BlackBerry Limited',
+    117: 'Samsung Electronics Co. Ltd.',
+    224: 'Google',
+    343: 'Xiaomi Inc.',
+    2050: 'Amazon.com Services, Inc.'
+}
+
+# Reportlab style objects are immutable after construction and expensive to
+# build, so they are shared across all generated reports
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    spaceAfter=20,
+    alignment=TA_CENTER,
+    textColor=colors.darkblue,
+    fontName='Helvetica-Bold'
+)
+
+_SUMMARY_STYLE = ParagraphStyle(
+    'SummaryStyle',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    spaceAfter=10,
+    alignment=TA_LEFT,
+    leftIndent=10
+)
+
+# Static skeleton of the PDF summary paragraph, rendered with one .format()
+# call per report instead of piecewise f-string concatenation
+_SCAN_INFO_TEMPLATE = """
+    <b>📅 Scan Information:</b> {scan_time} • Duration: {duration}s • BLE Protocol • Generated: {generated}<br/><br/>
+
+    <b>📊 Discovery Results:</b> <b>{device_count}</b> devices found • <b>{total_services}</b> services • <b>{manufacturer_count}</b> manufacturers • Avg: <b>{services_per_device:.1f}</b> services/device<br/><br/>
+
+    <b>📶 Signal Distribution:</b> Strong: <b>{strong}</b> ({strong_pct:.0f}%) • Medium: <b>{medium}</b> ({medium_pct:.0f}%) • Weak: <b>{weak}</b> ({weak_pct:.0f}%) • Very Weak: <b>{very_weak}</b> ({very_weak_pct:.0f}%) • RSSI: {avg_rssi:.1f} dBm avg<br/><br/>
+
+    <b>🏭 Top Manufacturers:</b> {manufacturer_summary}{type_summary}"""
+
+# Enhanced table with optimized column widths for landscape A4
+_COL_WIDTHS = [0.3*inch, 1.5*inch, 1.2*inch, 0.6*inch, 0.8*inch,
+               1.0*inch, 0.5*inch, 0.5*inch, 1.0*inch, 1.8*inch, 0.7*inch, 0.7*inch]
+
+_MAIN_TABLE_STYLE = TableStyle([
+    # Enhanced header styling
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+
+    # Enhanced data styling with better readability
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightblue]),
+
+    # Enhanced borders and padding
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+
+    # Special formatting for signal strength column
+    ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # RSSI column
+    ('ALIGN', (6, 0), (6, -1), 'CENTER'),  # Company ID column
+    ('ALIGN', (7, 0), (7, -1), 'CENTER'),  # Services count column
+])
+
+async def scan_bluetooth_devices(duration=10, service_uuids=None, min_devices=None):
     """
     Scans for nearby Bluetooth devices
-    
+
     Args:
         duration (int): Scanning duration in seconds
-    
+        service_uuids (list): Optional service UUIDs to filter on; the
+            filtering happens in the OS Bluetooth stack, so non-matching
+            advertisements never reach Python
+        min_devices (int): Optional early-stop threshold; the scan window
+            closes as soon as this many devices have been collected instead
+            of always running for the full duration
+
     Returns:
         dict: Dictionary with devices {address: (device, advertisement_data)}
     """
@@ -43,21 +274,31 @@ async def scan_bluetooth_devices(duration=10):
     print("=" * 50)
     
     try:
-        # Scan for Bluetooth Low Energy devices
+        # Scan for Bluetooth Low Energy devices with a streaming callback so a
+        # single continuous scan session collects advertisements as they arrive
         print("📡 Scanning for Bluetooth Low Energy (BLE) devices...")
-        ble_devices = await BleakScanner.discover(timeout=duration, return_adv=True)
-        
-        # Additional scan with longer time for some devices
-        if len(ble_devices) < 5:
-            print("🔄 Additional scanning (extended time)...")
-            additional_devices = await BleakScanner.discover(timeout=duration//2, return_adv=True)
-            # Merge results
-            for addr, data in additional_devices.items():
-                if addr not in ble_devices:
-                    ble_devices[addr] = data
-        
+        ble_devices = {}
+        enough = asyncio.Event()
+
+        def _on_detection(device, adv_data):
+            ble_devices[device.address] = (device, adv_data)
+            if min_devices is not None and len(ble_devices) >= min_devices:
+                enough.set()
+
+        # One continuous scan window on a single HCI session; the context
+        # manager takes care of starting and stopping the scanner. The wait
+        # ends early if the min_devices threshold trips, otherwise it runs
+        # for the full duration
+        async with BleakScanner(detection_callback=_on_detection,
+                                service_uuids=service_uuids):
+            try:
+                await asyncio.wait_for(enough.wait(), timeout=duration)
+                print(f"⏩ Found {len(ble_devices)} devices, stopping scan early")
+            except asyncio.TimeoutError:
+                pass
+
         return ble_devices
-        
+
     except Exception as e:
         print(f"❌ Error during scanning: {e}")
         return {}
@@ -69,47 +310,76 @@ def display_devices(devices):
     Args:
         devices (dict): Dictionary with devices {address: (device, advertisement_data)}
     """
+    # Accumulate output lines and flush them with a single write instead of
+    # issuing one syscall per print
+    out = []
+    w = out.append
+
     if not devices:
-        print("🚫 No Bluetooth devices found nearby.")
-        print("\n💡 Make sure that:")
-        print("   - Bluetooth is enabled on this computer")
-        print("   - Other devices have Bluetooth enabled and are discoverable")
-        print("   - You are within range of other Bluetooth devices")
-        print("   - Devices support Bluetooth Low Energy (BLE)")
+        w("🚫 No Bluetooth devices found nearby.")
+        w("\n💡 Make sure that:")
+        w("   - Bluetooth is enabled on this computer")
+        w("   - Other devices have Bluetooth enabled and are discoverable")
+        w("   - You are within range of other Bluetooth devices")
+        w("   - Devices support Bluetooth Low Energy (BLE)")
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         return
-    print(f"✅ Found {len(devices)} Bluetooth devices:")
-    print("=" * 70)
-    
+    w(f"✅ Found {len(devices)} Bluetooth devices:")
+    w("=" * 70)
+
     for i, (address, (device, adv_data)) in enumerate(devices.items(), 1):        # Get device name from various sources
         device_name = get_device_name(device, adv_data)
-        
-        print(f"{i:2d}. 📱 {device_name}")
-        print(f"    📍 MAC Address: {device.address}")
-        print(f"    📶 Signal Strength (RSSI): {adv_data.rssi if hasattr(adv_data, 'rssi') and adv_data.rssi else device.rssi} dBm")
-        print(f"    🔋 Signal Power: {get_signal_strength_description(adv_data.rssi if hasattr(adv_data, 'rssi') and adv_data.rssi else device.rssi)}")
-        
+        rssi = _resolve_rssi(device, adv_data)
+        manufacturer_data = adv_data.manufacturer_data
+        service_data = adv_data.service_data
+        service_uuids = adv_data.service_uuids
+
+        w(f"{i:2d}. 📱 {device_name}")
+        w(f"    📍 MAC Address: {device.address}")
+        w(f"    📶 Signal Strength (RSSI): {rssi} dBm")
+        w(f"    🔋 Signal Power: {get_signal_strength_description(rssi)}")
+
         # Additional information from advertisement data
-        if adv_data.manufacturer_data:
-            print(f"    🏭 Manufacturer data: {len(adv_data.manufacturer_data)} entries")
+        if manufacturer_data:
+            w(f"    🏭 Manufacturer data: {len(manufacturer_data)} entries")
             # Show manufacturer details
-            for company_id, data in list(adv_data.manufacturer_data.items())[:2]:
+            for company_id, data in islice(manufacturer_data.items(), 2):
                 company_name = get_company_name(company_id)
-                print(f"       • {company_name}")
-        
-        if adv_data.service_data:
-            print(f"    🔧 Service data: {len(adv_data.service_data)} services")
-        
-        if adv_data.service_uuids:
-            print(f"    🆔 Service UUIDs: {len(adv_data.service_uuids)} services")
-            for uuid in adv_data.service_uuids[:3]:  # Show first 3
+                w(f"       • {company_name}")
+
+        if service_data:
+            w(f"    🔧 Service data: {len(service_data)} services")
+
+        if service_uuids:
+            w(f"    🆔 Service UUIDs: {len(service_uuids)} services")
+            for uuid in service_uuids[:3]:  # Show first 3
                 service_name = get_service_name(uuid)
-                print(f"       • {service_name}")
-            if len(adv_data.service_uuids) > 3:
-                print(f"       • ... and {len(adv_data.service_uuids) - 3} more")
-        
-        print(f"    🔗 Type: {get_device_type(device_name, adv_data)}")
-        print("-" * 50)
+                w(f"       • {service_name}")
+            if len(service_uuids) > 3:
+                w(f"       • ... and {len(service_uuids) - 3} more")
+
+        w(f"    🔗 Type: {get_device_type(device_name, adv_data)}")
+        w("-" * 50)
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+
+def _resolve_rssi(device, adv_data):
+    """
+    Resolves the RSSI for a device, preferring advertisement data
+
+    Args:
+        device: BLEDevice object
+        adv_data: Device advertisement data
+
+    Returns:
+        int: RSSI value in dBm
+    """
+    rssi = getattr(adv_data, 'rssi', None)
+    return rssi if rssi else device.rssi
 
+@lru_cache(maxsize=512)
 def get_signal_strength_description(rssi):
     """
     Converts RSSI value to signal strength description
@@ -120,17 +390,9 @@ def get_signal_strength_description(rssi):
     Returns:
         str: Signal strength description
     """
-    if rssi >= -30:
-        return "Very Strong 📶📶📶📶"
-    elif rssi >= -50:
-        return "Strong 📶📶📶"
-    elif rssi >= -70:
-        return "Medium 📶📶"
-    elif rssi >= -90:
-        return "Weak 📶"
-    else:
-        return "Very Weak 📵"
+    return _RSSI_DESCRIPTIONS[bisect_right(_RSSI_THRESHOLDS, rssi)]
 
+@lru_cache(maxsize=512)
 def get_service_name(uuid):
     """
     Maps service UUID to readable name
@@ -141,75 +403,92 @@ def get_service_name(uuid):
     Returns:
         str: Service name
     """
-    # Standard Bluetooth service UUIDs
-    service_names = {
-        "0000180f-0000-1000-8000-00805f9b34fb": "Battery Service",
-        "0000180a-0000-1000-8000-00805f9b34fb": "Device Information",
-        "0000181c-0000-1000-8000-00805f9b34fb": "User Data",
-        "0000180d-0000-1000-8000-00805f9b34fb": "Heart Rate",
-        "0000181a-0000-1000-8000-00805f9b34fb": "Environmental Sensing",
-        "0000180f-0000-1000-8000-00805f9b34fb": "Battery Service",
-        "0000110a-0000-1000-8000-00805f9b34fb": "Audio Source",
-        "0000110b-0000-1000-8000-00805f9b34fb": "Audio Sink",
-        "0000111e-0000-1000-8000-00805f9b34fb": "Hands-Free",
-        "6e400001-b5a3-f393-e0a9-e50e24dcca9e": "Nordic UART Service"
-    }
-    
     # Try to find full UUID
     full_uuid = str(uuid).lower()
-    if full_uuid in service_names:
-        return service_names[full_uuid]
-    
-    # Try short UUID (first 4 characters)
-    short_uuid = full_uuid[:8]
-    for full, name in service_names.items():
-        if full.startswith(short_uuid):
-            return name
-    
-    return "Unknown service"
+    if full_uuid in _SERVICE_NAMES:
+        return _SERVICE_NAMES[full_uuid]
 
-def get_device_type(name, adv_data):
+    # Try short UUID (first 8 characters)
+    return _SERVICE_NAMES_BY_SHORT.get(full_uuid[:8], "Unknown service")
+
+def get_device_type(name, adv_data, _name_lower=None):
     """
     Próbuje określić typ urządzenia na podstawie nazwy i danych reklamowych
-    
+
     Args:
         name (str): Nazwa urządzenia
         adv_data: Dane reklamowe urządzenia
-    
+        _name_lower (str): Opcjonalna, już obniżona nazwa (pomija ponowne lower())
+
     Returns:
         str: Domniemany typ urządzenia
     """
-    name_lower = name.lower() if name else ""
-    
-    # Analiza nazwy urządzenia
-    if any(keyword in name_lower for keyword in ['airpods', 'headphones', 'earbuds', 'speaker', 'audio']):        return "🎧 Audio Device"
-    elif any(keyword in name_lower for keyword in ['iphone', 'samsung', 'phone', 'mobile']):
-        return "📱 Mobile Phone"
-    elif any(keyword in name_lower for keyword in ['watch', 'band', 'fitness']):
-        return "⌚ Wearable Device"
-    elif any(keyword in name_lower for keyword in ['mouse', 'keyboard', 'trackpad']):
-        return "🖱️ Input Device"
-    elif any(keyword in name_lower for keyword in ['tv', 'display', 'monitor']):
-        return "📺 Display Device"
-    elif any(keyword in name_lower for keyword in ['sensor', 'thermometer', 'humidity']):
-        return "🌡️ Sensor"
-    elif any(keyword in name_lower for keyword in ['light', 'bulb', 'lamp']):
-        return "💡 Smart Light"
-      # Analyze service UUIDs
-    if adv_data.service_uuids:
-        service_types = []
-        for uuid in adv_data.service_uuids:
-            service_name = get_service_name(uuid)
-            service_types.append(service_name.lower())
-        
-        if any('heart rate' in s for s in service_types):
-            return "❤️ Heart Rate Monitor"
-        elif any('battery' in s for s in service_types):
-            return "🔋 Battery Device"
-        elif any('audio' in s for s in service_types):
-            return "🎵 Audio Device"
-    
-    return "🔵 Bluetooth Low Energy Device"
+    name_lower = _name_lower if _name_lower is not None else (name.lower() if name else "")
+
+    # adv_data samo w sobie nie jest hashowalne, więc memoizacja odbywa się na
+    # wyciągniętych, hashowalnych wejściach
+    service_uuids = adv_data.service_uuids
+    return _classify_device_type(name_lower, tuple(service_uuids) if service_uuids else ())
+
+@lru_cache(maxsize=512)
+def _classify_device_type(name_lower, service_uuids):
+    """
+    Klasyfikuje typ urządzenia na podstawie obniżonej nazwy i krotki UUID usług
+
+    Args:
+        name_lower (str): Obniżona nazwa urządzenia
+        service_uuids (tuple): Krotka UUID usług z danych reklamowych
+
+    Returns:
+        str: Domniemany typ urządzenia
+    """
+    # Analiza nazwy urządzenia - pusta nazwa nigdy nie pasuje, więc od razu
+    # przechodzimy do klasyfikacji po usługach. Wzorce są ułożone według
+    # priorytetu kategorii, więc pierwsze trafienie odpowiada drabince if/elif
+    if name_lower:
+        for pattern, label in _DEVICE_TYPE_PATTERNS:
+            if pattern.search(name_lower):
+                return label
+
+    # Analyze service UUIDs
+    if service_uuids:
+        service_types = {get_service_name(uuid).lower() for uuid in service_uuids}
+
+        if service_types & _HEART_RATE_SERVICES:
+            return _TYPE_HEART_RATE
+        elif service_types & _BATTERY_SERVICES:
+            return _TYPE_BATTERY
+        elif service_types & _AUDIO_SERVICES:
+            return _TYPE_AUDIO_SERVICE
+
+    return _TYPE_BLE_DEFAULT
+
+def get_device_types_batch(names, service_uuids_list=None):
+    """
+    Klasyfikuje wiele nazw urządzeń w jednym przebiegu
+
+    Korzysta z tego samego skompilowanego wyrażenia regularnego i pamięci
+    podręcznej co get_device_type, więc powtarzające się nazwy (częste przy
+    skanowaniu 100+ urządzeń) kosztują tylko jedno wyszukiwanie.
+
+    Args:
+        names (list): Lista nazw urządzeń (mogą być None)
+        service_uuids_list (list): Opcjonalna lista krotek UUID usług,
+            równoległa do names
+
+    Returns:
+        list: Lista typów urządzeń w kolejności wejścia
+    """
+    if service_uuids_list is None:
+        return [
+            _classify_device_type(name.lower() if name else "", ())
+            for name in names
+        ]
+    return [
+        _classify_device_type(name.lower() if name else "",
+                              tuple(uuids) if uuids else ())
+        for name, uuids in zip(names, service_uuids_list)
+    ]
 
 async def get_detailed_info(address):
     """
@@ -224,7 +503,13 @@ async def get_detailed_info(address):
     try:
         async with BleakClient(address) as client:
             if await client.is_connected():
-                services = await client.get_services()
+                try:
+                    # bleak >= 0.20 populates the services collection during
+                    # the connect handshake; reading the property avoids a
+                    # redundant GATT discovery round-trip
+                    services = tuple(client.services)
+                except AttributeError:
+                    services = tuple(await client.get_services())
                 return {
                     'connected': True,
                     'services': [str(s.uuid) for s in services],
@@ -268,6 +553,7 @@ def get_device_name(device, adv_data):
     mac_suffix = device.address.split(':')[-2:]
     return f"BLE Device ({':'.join(mac_suffix)})"
 
+@lru_cache(maxsize=512)
 def get_manufacturer_from_mac(mac_address):
     """
     Określa producenta na podstawie OUI (Organizationally Unique Identifier) w adresie MAC
@@ -278,72 +564,13 @@ def get_manufacturer_from_mac(mac_address):
     Returns:
         str: Nazwa producenta lub None
     """
-    # Pobierz pierwsze 3 bajty adresu MAC (OUI)
-    oui = mac_address.upper().replace(':', '').replace('-', '')[:6]
-    
-    # Słownik popularnych OUI i producentów
-    oui_manufacturers = {
-        '000000': 'Xerox',
-        '0001C8': 'Hewlett Packard',
-        '000C29': 'VMware',
-        '001B63': 'Apple',
-        '00A040': 'Apple',
-        '28E02C': 'Apple',
-        '2C5490': 'Apple',
-        '3CAB8E': 'Apple',
-        '4025C2': 'Apple',
-        '509EA7': 'Apple',
-        '68AB1E': 'Apple',
-        '6C2483': 'Apple',
-        '7CFA4E': 'Apple',
-        '84F3EB': 'Apple',
-        '8C2937': 'Apple',
-        '90B21F': 'Apple',
-        'A4C361': 'Apple',
-        'B8E856': 'Apple',
-        'C82A14': 'Apple',
-        'D023DB': 'Apple',
-        'E4C63D': 'Apple',
-        'E8802E': 'Apple',
-        'EC8892': 'Apple',
-        'F01C13': 'Apple',
-        'F40E22': 'Apple',
-        '0050F2': 'Microsoft',
-        '00155D': 'Microsoft',
-        '001DD8': 'Microsoft',
-        '0017FA': 'Microsoft',
-        '7C1E52': 'Microsoft',
-        '000272': 'Intel',
-        '001B77': 'Intel',
-        '0050F2': 'Intel',
-        '24F5AA': 'Intel',
-        '34E6AD': 'Intel',
-        '7085C2': 'Intel',
-        '001377': 'Samsung',
-        '002454': 'Samsung',
-        '00374A': 'Samsung',
-        '003EE1': 'Samsung',
-        '74DA38': 'Samsung',
-        '8C77121': 'Samsung',
-        'C869CD': 'Samsung',
-        'E84E06': 'Samsung',
-        'F09FC2': 'Samsung',
-        '000F86': 'Huawei',
-        '001E10': 'Huawei',
-        '003048': 'Huawei',
-        '00664C': 'Huawei',
-        '001CF0': 'LG Electronics',
-        '001E75': 'LG Electronics',
-        '002140': 'LG Electronics',
-        '0021D1': 'LG Electronics',
-        '00E04C': 'Realtek',
-        '52540E': 'Realtek',
-        '9CEB2E': 'Realtek',
-        'B0359E': 'Realtek'
-    }
-    
-    return oui_manufacturers.get(oui)
+    # Pobierz pierwsze 3 bajty adresu MAC (OUI) - 8 znaków prefiksu wystarcza
+    # na 3 bajty z separatorami, więc reszta adresu nie jest kopiowana
+    oui = mac_address[:8].translate(_MAC_STRIP).upper()[:6]
+
+    return _OUI_MANUFACTURERS.get(oui)
 
+@lru_cache(maxsize=512)
 def get_company_name(company_id):
     """
     Maps Company ID to company name
@@ -354,32 +581,7 @@ def get_company_name(company_id):
     Returns:
         str: Company name
     """
-    company_names = {
-        0: 'Ericsson Technology Licensing',
-        1: 'Nokia Mobile Phones',
-        2: 'Intel Corp.',
-        3: 'IBM Corp.',
-        4: 'Toshiba Corp.',
-        5: '3Com',
-        6: 'Microsoft',
-        7: 'Lucent',
-        8: 'Motorola',
-        9: 'Infineon Technologies AG',
-        10: 'Qualcomm Technologies International, Ltd.',
-        15: 'Broadcom Corporation',
-        29: 'Texas Instruments Inc.',
-        48: 'Hewlett-Packard Company',
-        57: 'AVM Berlin',
-        69: 'Aruba Networks',
-        76: 'Apple, Inc.',
-        89: 'BlackBerry Limited',
-        117: 'Samsung Electronics Co. Ltd.',
-        224: 'Google',
-        343: 'Xiaomi Inc.',
-        2050: 'Amazon.com Services, Inc.'
-    }
-    
-    return company_names.get(company_id, f"Unknown company (ID: {company_id})")
+    return _COMPANY_NAMES.get(company_id, f"Unknown company (ID: {company_id})")
 
 def get_device_type_from_manufacturer_data(adv_data):
     """
@@ -391,11 +593,12 @@ def get_device_type_from_manufacturer_data(adv_data):
     Returns:
         str: Device type or None
     """
-    if not adv_data.manufacturer_data:
+    manufacturer_data = adv_data.manufacturer_data
+    if not manufacturer_data:
         return None
-    
+
     # Check company ID from manufacturer data
-    for company_id, data in adv_data.manufacturer_data.items():
+    for company_id, data in manufacturer_data.items():
         # Apple
         if company_id == 76:  # 0x004C - Apple
             if len(data) >= 2:
@@ -441,30 +644,65 @@ async def main():
     print(f"📅 Date: {scan_time}")
     print("=" * 50)
     
+    # Optional --filter-uuid arguments narrow the scan to specific services
+    # at the OS level (may be repeated)
+    args = sys.argv[1:]
+    service_filter = [args[i + 1] for i, arg in enumerate(args)
+                      if arg == '--filter-uuid' and i + 1 < len(args)] or None
+    if service_filter:
+        print(f"🔎 Filtering on service UUIDs: {', '.join(service_filter)}")
+
     try:
         # Scan for devices
         scan_duration = 10
-        devices = await scan_bluetooth_devices(duration=scan_duration)
+        devices = await scan_bluetooth_devices(duration=scan_duration,
+                                               service_uuids=service_filter)
         
         # Display results
         display_devices(devices)
-        
+
         # Optional: detailed information for selected devices
-        if devices and len(devices) <= 3:
+        targets = list(islice(devices.items(), 3)) if devices and len(devices) <= 3 else []
+        if targets:
             print("\n🔍 Attempting to get detailed information...")
-            for address, (device, adv_data) in list(devices.items())[:3]:
-                print(f"\n🔗 Connecting to {device.name or address}...")
-                details = await get_detailed_info(address)
-                if details.get('connected'):
-                    print(f"   ✅ Connected! Services: {len(details['services'])}, Characteristics: {details['characteristics']}")
-                else:
-                    print(f"   ❌ Cannot connect: {details.get('error', 'No response')}")
-        
-        # Generate PDF report
+
+        # Pipeline the two independent phases: the PDF renders in a worker
+        # thread while the BLE detail probes run on the event loop. The PDF
+        # task stays outside the TaskGroup so a render failure surfaces at
+        # the dedicated `await pdf_task` below instead of cancelling the
+        # detail probes and escaping as an ExceptionGroup
+        pdf_task = None
+        details_list = []
         if devices:
+            pdf_task = asyncio.create_task(asyncio.to_thread(
+                generate_pdf_report, devices, scan_time, scan_duration))
+        if hasattr(asyncio, 'TaskGroup'):
+            # Structured concurrency on Python 3.11+: all probes are awaited
+            # (and cancelled together on failure) at block exit
+            async with asyncio.TaskGroup() as tg:
+                detail_tasks = [tg.create_task(get_detailed_info(address))
+                                for address, _ in targets]
+            details_list = [task.result() for task in detail_tasks]
+        elif targets:
+            # Pre-3.11 fallback with the same overlap
+            details_list = await asyncio.gather(
+                *(get_detailed_info(address) for address, _ in targets),
+                return_exceptions=True)
+
+        for (address, (device, adv_data)), details in zip(targets, details_list):
+            print(f"\n🔗 Connecting to {device.name or address}...")
+            if isinstance(details, BaseException):
+                print(f"   ❌ Cannot connect: {details}")
+            elif details.get('connected'):
+                print(f"   ✅ Connected! Services: {len(details['services'])}, Characteristics: {details['characteristics']}")
+            else:
+                print(f"   ❌ Cannot connect: {details.get('error', 'No response')}")
+        
+        # Collect the PDF report
+        if pdf_task is not None:
             print("\n📄 Generating PDF report...")
             try:
-                pdf_path = generate_pdf_report(devices, scan_time, scan_duration)
+                pdf_path = await pdf_task
                 print(f"✅ PDF report generated: {os.path.basename(pdf_path)}")
                 print(f"📁 Location: {pdf_path}")
             except Exception as e:
@@ -492,68 +730,76 @@ def generate_pdf_report(devices, scan_time, duration):
     Returns:
         str: Path to generated PDF file
     """
-    from reportlab.lib.pagesizes import A4, landscape
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-    
     # Filename with date and time
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"bluetooth_scan_report_{timestamp}.pdf"
     filepath = os.path.join(os.getcwd(), filename)
     
     # Create PDF document with landscape orientation for better table layout
-    doc = SimpleDocTemplate(filepath, pagesize=landscape(A4), 
+    doc = SimpleDocTemplate(filepath, pagesize=landscape(A4),
                           leftMargin=0.5*inch, rightMargin=0.5*inch,
-                          topMargin=0.5*inch, bottomMargin=0.5*inch)
+                          topMargin=0.5*inch, bottomMargin=0.5*inch,
+                          pageCompression=1)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Enhanced custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        textColor=colors.darkblue,
-        fontName='Helvetica-Bold'
-    )
-    
-    summary_style = ParagraphStyle(
-        'SummaryStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=10,
-        alignment=TA_LEFT,
-        leftIndent=10
-    )
       # Title
-    story.append(Paragraph("🔵 Professional Bluetooth Low Energy (BLE) Device Scan Report", title_style))
+    story.append(Paragraph("🔵 Professional Bluetooth Low Energy (BLE) Device Scan Report", _TITLE_STYLE))
     story.append(Spacer(1, 8))
-    
+
+    # Nothing to analyze: emit a minimal report and skip the stats pipeline
+    # entirely (this also guards the per-device percentage divisions below
+    # against ZeroDivisionError for direct callers)
+    if not devices:
+        story.append(Paragraph("No Bluetooth devices found during the scan.", _STYLES['Normal']))
+        doc.build(story)
+        return filepath
+
     # Enhanced scan summary with comprehensive statistics
     device_count = len(devices)
-    manufacturers = {}
+    manufacturers = Counter()
     signal_strengths = {'Strong': 0, 'Medium': 0, 'Weak': 0, 'Very Weak': 0}
-    device_types = {}
+    device_types = Counter()
     total_services = 0
     rssi_values = []
-    
-    # Calculate detailed statistics
-    for address, (device, adv_data) in devices.items():
+    table_rows = []
+
+    # Single pass over devices: compute statistics and build table rows together,
+    # resolving name/type/RSSI once per device instead of once per loop
+    for i, (address, (device, adv_data)) in enumerate(devices.items(), 1):
+        rssi = _resolve_rssi(device, adv_data)
+        manufacturer_data = adv_data.manufacturer_data
+        service_uuids = adv_data.service_uuids
+        service_data = adv_data.service_data
+
+        # Reuse the formatted row (minus the position column) when the same
+        # advertisement fingerprint was already processed by an earlier report.
+        # The key covers every input the row is rendered from: both name
+        # sources, manufacturer IDs with their payload bytes (the name/type
+        # fallback reads payload content, not just its size), service UUIDs
+        # and the service-data sizes, so a device that gains a name or new
+        # data between reports never serves a stale row
+        row_key = (address, rssi, device.name,
+                   getattr(adv_data, 'local_name', None),
+                   tuple((cid, bytes(data)) for cid, data in manufacturer_data.items()) if manufacturer_data else (),
+                   tuple(service_uuids) if service_uuids else (),
+                   tuple((uuid, len(data)) for uuid, data in service_data.items()) if service_data else ())
+        cached = _ROW_CACHE.get(row_key)
+        if cached is not None:
+            _ROW_CACHE.move_to_end(row_key)
+            device_name, device_type, row_tail = cached
+        else:
+            device_name = get_device_name(device, adv_data)
+            device_type = get_device_type(device_name, adv_data)
+            row_tail = None
+
         # Count manufacturers
-        if adv_data.manufacturer_data:
-            for company_id in adv_data.manufacturer_data.keys():
+        if manufacturer_data:
+            for company_id in manufacturer_data.keys():
                 company_name = get_company_name(company_id)
                 if "Unknown company" in company_name:
                     company_name = f"Unknown (ID: {company_id})"
-                manufacturers[company_name] = manufacturers.get(company_name, 0) + 1
-        
+                manufacturers[company_name] += 1
+
         # Count signal strengths and collect RSSI values
-        rssi = adv_data.rssi if hasattr(adv_data, 'rssi') and adv_data.rssi else device.rssi
         if rssi:
             rssi_values.append(rssi)
             if rssi >= -50:
@@ -564,112 +810,49 @@ def generate_pdf_report(devices, scan_time, duration):
                 signal_strengths['Weak'] += 1
             else:
                 signal_strengths['Very Weak'] += 1
-        
+
         # Count device types
-        device_name = get_device_name(device, adv_data)
-        device_type = get_device_type(device_name, adv_data)
-        device_types[device_type] = device_types.get(device_type, 0) + 1
-        
+        device_types[device_type] += 1
+
         # Count services
-        if adv_data.service_uuids:
-            total_services += len(adv_data.service_uuids)
-    
-    # Calculate RSSI statistics
-    avg_rssi = sum(rssi_values) / len(rssi_values) if rssi_values else 0
-    min_rssi = min(rssi_values) if rssi_values else 0
-    max_rssi = max(rssi_values) if rssi_values else 0
-      # Create comprehensive but compact summary
-    scan_info_text = f"""
-    <b>📅 Scan Information:</b> {scan_time} • Duration: {duration}s • BLE Protocol • Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/><br/>
-    
-    <b>📊 Discovery Results:</b> <b>{device_count}</b> devices found • <b>{total_services}</b> services • <b>{len(manufacturers)}</b> manufacturers • Avg: <b>{total_services/device_count:.1f}</b> services/device<br/><br/>
-    
-    <b>📶 Signal Distribution:</b> Strong: <b>{signal_strengths['Strong']}</b> ({signal_strengths['Strong']/device_count*100:.0f}%) • Medium: <b>{signal_strengths['Medium']}</b> ({signal_strengths['Medium']/device_count*100:.0f}%) • Weak: <b>{signal_strengths['Weak']}</b> ({signal_strengths['Weak']/device_count*100:.0f}%) • Very Weak: <b>{signal_strengths['Very Weak']}</b> ({signal_strengths['Very Weak']/device_count*100:.0f}%) • RSSI: {avg_rssi:.1f} dBm avg<br/><br/>
-    
-    <b>🏭 Top Manufacturers:</b> """
-    
-    # Add top manufacturers in compact format
-    if manufacturers:
-        top_manufacturers = sorted(manufacturers.items(), key=lambda x: x[1], reverse=True)[:3]
-        manufacturer_list = []
-        for manufacturer, count in top_manufacturers:
-            percentage = count/device_count*100
-            manufacturer_list.append(f"{manufacturer} ({count}, {percentage:.0f}%)")
-        scan_info_text += " • ".join(manufacturer_list)
-    else:
-        scan_info_text += "No manufacturer data available"
-    
-    # Add device types in compact format
-    if device_types:
-        scan_info_text += "<br/><b>🔧 Device Types:</b> "
-        top_types = sorted(device_types.items(), key=lambda x: x[1], reverse=True)[:3]
-        type_list = []
-        for device_type, count in top_types:
-            percentage = count/device_count*100
-            type_list.append(f"{device_type} ({count}, {percentage:.0f}%)")
-        scan_info_text += " • ".join(type_list)
-    
-    story.append(Paragraph(scan_info_text, summary_style))
-    story.append(Spacer(1, 10))
-      # Enhanced comprehensive device table optimized for landscape
-    if not devices:
-        story.append(Paragraph("No Bluetooth devices found during the scan.", styles['Normal']))
-    else:
-        # Enhanced table headers with more detailed information
-        headers = [
-            '#', 'Device Name', 'MAC Address', 'RSSI\n(dBm)', 'Signal\nStrength', 
-            'Manufacturer', 'Company\nID', 'Services\nCount', 'Device Type', 
-            'Primary Services', 'Manufacturer\nData Size', 'Service\nData Size'
-        ]
-        
-        table_data = [headers]
-        
-        for i, (address, (device, adv_data)) in enumerate(devices.items(), 1):
-            device_name = get_device_name(device, adv_data)
-            rssi = adv_data.rssi if hasattr(adv_data, 'rssi') and adv_data.rssi else device.rssi
+        if service_uuids:
+            total_services += len(service_uuids)
+
+        if row_tail is None:
             rssi_str = str(rssi) if rssi else "N/A"
-            
+
             # Enhanced signal strength description with visual indicators
             if rssi:
-                if rssi >= -50:
-                    signal_desc = "📶📶📶 Strong"
-                elif rssi >= -70:
-                    signal_desc = "📶📶 Medium"
-                elif rssi >= -90:
-                    signal_desc = "📶 Weak"
-                else:
-                    signal_desc = "📵 Very Weak"
+                signal_desc = _RSSI_TABLE_LABELS[bisect_right(_RSSI_THRESHOLDS, rssi)]
             else:
                 signal_desc = "❓ N/A"
-            
+
             # Enhanced manufacturer information
             main_manufacturer = "Unknown"
             company_id_str = "N/A"
             manufacturer_data_size = 0
-            
-            if adv_data.manufacturer_data:
-                first_company_id = list(adv_data.manufacturer_data.keys())[0]
+
+            if manufacturer_data:
+                first_company_id = next(iter(manufacturer_data))
                 company_id_str = str(first_company_id)
                 main_manufacturer = get_company_name(first_company_id)
                 if "Unknown company" in main_manufacturer:
                     main_manufacturer = f"Unknown (ID:{first_company_id})"
-                
+
                 # Calculate total manufacturer data size
-                manufacturer_data_size = sum(len(data) for data in adv_data.manufacturer_data.values())
-            
+                manufacturer_data_size = sum(len(data) for data in manufacturer_data.values())
+
             # Enhanced services information
-            services_count = len(adv_data.service_uuids) if adv_data.service_uuids else 0
-            
+            services_count = len(service_uuids) if service_uuids else 0
+
             # Enhanced device type detection
-            device_type = get_device_type(device_name, adv_data)
-            if len(device_type) > 18:
-                device_type = device_type[:15] + "..."
-            
+            device_type_cell = _TYPE_PDF_CELLS.get(device_type, device_type)
+
             # Enhanced services list with more details
             primary_services = "None"
-            if adv_data.service_uuids:
+            if service_uuids:
                 service_names = []
-                for uuid in adv_data.service_uuids[:3]:  # Show top 3 services
+                for uuid in service_uuids[:3]:  # Show top 3 services
                     service_name = get_service_name(uuid)
                     if "Unknown service" not in service_name:
                         short_name = service_name.split('(')[0].strip()
@@ -680,24 +863,23 @@ def generate_pdf_report(devices, scan_time, duration):
                         # Show shortened UUID for unknown services
                         short_uuid = str(uuid)[:8]
                         service_names.append(f"{short_uuid}...")
-                
+
                 if service_names:
                     primary_services = ", ".join(service_names)
-                    if len(adv_data.service_uuids) > 3:
-                        primary_services += f" (+{len(adv_data.service_uuids)-3})"
-            
+                    if len(service_uuids) > 3:
+                        primary_services += f" (+{len(service_uuids)-3})"
+
             # Service data size
             service_data_size = 0
-            if adv_data.service_data:
-                service_data_size = sum(len(data) for data in adv_data.service_data.values())
-            
+            if service_data:
+                service_data_size = sum(len(data) for data in service_data.values())
+
             # Optimize text length for landscape table
             device_name_short = device_name[:20] + "..." if len(device_name) > 20 else device_name
             main_manufacturer_short = main_manufacturer[:15] + "..." if len(main_manufacturer) > 15 else main_manufacturer
             primary_services_short = primary_services[:30] + "..." if len(primary_services) > 30 else primary_services
-            
-            row = [
-                str(i),
+
+            row_tail = [
                 device_name_short,
                 device.address,
                 rssi_str,
@@ -705,50 +887,78 @@ def generate_pdf_report(devices, scan_time, duration):
                 main_manufacturer_short,
                 company_id_str,
                 str(services_count),
-                device_type,
+                device_type_cell,
                 primary_services_short,
                 f"{manufacturer_data_size} bytes" if manufacturer_data_size > 0 else "0",
                 f"{service_data_size} bytes" if service_data_size > 0 else "0"
             ]
-            
-            table_data.append(row)
-          # Enhanced table with optimized column widths for landscape A4
-        col_widths = [0.3*inch, 1.5*inch, 1.2*inch, 0.6*inch, 0.8*inch, 
-                     1.0*inch, 0.5*inch, 0.5*inch, 1.0*inch, 1.8*inch, 0.7*inch, 0.7*inch]
-        
-        main_table = Table(table_data, colWidths=col_widths, repeatRows=1)
-        main_table.setStyle(TableStyle([
-            # Enhanced header styling
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            
-            # Enhanced data styling with better readability
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightblue]),
-            
-            # Enhanced borders and padding
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-            
-            # Special formatting for signal strength column
-            ('ALIGN', (3, 0), (3, -1), 'CENTER'),  # RSSI column
-            ('ALIGN', (6, 0), (6, -1), 'CENTER'),  # Company ID column
-            ('ALIGN', (7, 0), (7, -1), 'CENTER'),  # Services count column
-        ]))
-        
-        story.append(main_table)
+            _ROW_CACHE[row_key] = (device_name, device_type, row_tail)
+            if len(_ROW_CACHE) > _ROW_CACHE_MAX:
+                _ROW_CACHE.popitem(last=False)
+
+        table_rows.append([str(i)] + row_tail)
+
+    # Calculate RSSI statistics
+    avg_rssi = sum(rssi_values) / len(rssi_values) if rssi_values else 0
+    min_rssi = min(rssi_values) if rssi_values else 0
+    max_rssi = max(rssi_values) if rssi_values else 0
+      # Create comprehensive but compact summary: precompute the dynamic
+    # pieces, then render the static template with a single format call
+    if manufacturers:
+        manufacturer_summary = " • ".join(
+            f"{manufacturer} ({count}, {count/device_count*100:.0f}%)"
+            for manufacturer, count in manufacturers.most_common(3))
+    else:
+        manufacturer_summary = "No manufacturer data available"
+
+    type_summary = ""
+    if device_types:
+        type_summary = "<br/><b>🔧 Device Types:</b> " + " • ".join(
+            f"{device_type} ({count}, {count/device_count*100:.0f}%)"
+            for device_type, count in device_types.most_common(3))
+
+    scan_info_text = _SCAN_INFO_TEMPLATE.format(
+        scan_time=scan_time,
+        duration=duration,
+        generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        device_count=device_count,
+        total_services=total_services,
+        manufacturer_count=len(manufacturers),
+        services_per_device=total_services / device_count,
+        strong=signal_strengths['Strong'],
+        strong_pct=signal_strengths['Strong'] / device_count * 100,
+        medium=signal_strengths['Medium'],
+        medium_pct=signal_strengths['Medium'] / device_count * 100,
+        weak=signal_strengths['Weak'],
+        weak_pct=signal_strengths['Weak'] / device_count * 100,
+        very_weak=signal_strengths['Very Weak'],
+        very_weak_pct=signal_strengths['Very Weak'] / device_count * 100,
+        avg_rssi=avg_rssi,
+        manufacturer_summary=manufacturer_summary,
+        type_summary=type_summary)
+
+    story.append(Paragraph(scan_info_text, _SUMMARY_STYLE))
+    story.append(Spacer(1, 10))
+      # Enhanced comprehensive device table optimized for landscape
+    # Enhanced table headers with more detailed information
+    headers = [
+        '#', 'Device Name', 'MAC Address', 'RSSI\n(dBm)', 'Signal\nStrength',
+        'Manufacturer', 'Company\nID', 'Services\nCount', 'Device Type',
+        'Primary Services', 'Manufacturer\nData Size', 'Service\nData Size'
+    ]
+
+    table_data = [headers] + table_rows
+
+    # LongTable splits by row on page breaks without re-measuring the
+    # whole grid, which matters once scans grow past one page
+    main_table = LongTable(table_data, colWidths=_COL_WIDTHS, repeatRows=1, splitByRow=1)
+    main_table.setStyle(_MAIN_TABLE_STYLE)
+
+    story.append(main_table)
     
     # Enhanced footer with technical information
     story.append(Spacer(1, 20))
-    story.append(Paragraph("=" * 120, styles['Normal']))
+    story.append(Paragraph("=" * 120, _STYLES['Normal']))
     
     footer_text = f"""
     <b>🔧 Technical Report Information:</b><br/>
@@ -760,7 +970,7 @@ def generate_pdf_report(devices, scan_time, duration):
     • Data Sources: Device advertisements, manufacturer data, service UUIDs, signal strength
     """
     
-    story.append(Paragraph(footer_text, styles['Normal']))
+    story.append(Paragraph(footer_text, _STYLES['Normal']))
     
     # Build document
     doc.build(story)    
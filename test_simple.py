@@ -6,95 +6,69 @@ Simple test to verify bluetooth scanner functions work correctly
 import sys
 import os
 
+import pytest
+
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import the module
 import bluetooth_scanner
 
-def test_get_company_name():
-    """Test company name detection"""
-    print("Testing get_company_name...")
-    
-    # Test known manufacturers
-    assert bluetooth_scanner.get_company_name(76) == "Apple, Inc."  # Apple is ID 76, not 0x004C
-    assert bluetooth_scanner.get_company_name(6) == "Microsoft"
-    assert bluetooth_scanner.get_company_name(15) == "Broadcom Corporation"
-    
-    # Test unknown manufacturer
-    result = bluetooth_scanner.get_company_name(9999)
-    assert "Unknown company" in result
-    
-    # Test edge cases with None
-    result = bluetooth_scanner.get_company_name(None)
-    assert "Unknown company" in result
-    
-    print("✅ get_company_name tests passed!")
-
-def test_get_device_type():
+# Bind hot helpers as module-level locals so parametrized tests skip the
+# repeated attribute lookup on the module object
+_get_company_name = bluetooth_scanner.get_company_name
+_get_device_type = bluetooth_scanner.get_device_type
+_get_signal_strength = bluetooth_scanner.get_signal_strength_description
+
+
+class MockAdvData:
+    """Minimal advertisement data stand-in for classification tests"""
+    __slots__ = ("manufacturer_data", "service_uuids")
+
+    def __init__(self):
+        self.manufacturer_data = {}
+        self.service_uuids = []
+
+
+@pytest.mark.parametrize("company_id,expected", [
+    (76, "Apple, Inc."),  # Apple is ID 76, not 0x004C
+    (6, "Microsoft"),
+    (15, "Broadcom Corporation"),
+])
+def test_get_company_name_known(company_id, expected):
+    """Test company name detection for known manufacturers"""
+    assert _get_company_name(company_id) == expected
+
+
+@pytest.mark.parametrize("company_id", [9999, None])
+def test_get_company_name_unknown(company_id):
+    """Test company name fallback for unknown manufacturers"""
+    assert "Unknown company" in _get_company_name(company_id)
+
+
+@pytest.mark.parametrize("name,expected_fragments", [
+    ("iPhone 15", ("Mobile Phone", "📱")),
+    ("AirPods Pro", ("Audio Device", "🎧")),
+    ("Apple Watch", ("Wearable Device", "⌚")),
+    ("Unknown Device", ("Bluetooth", "🔵")),
+])
+def test_get_device_type(name, expected_fragments):
     """Test device type detection"""
-    print("Testing get_device_type...")
-    
-    # Create mock advertisement data
-    class MockAdvData:
-        def __init__(self):
-            self.manufacturer_data = {}
-            self.service_uuids = []
-    
-    mock_adv = MockAdvData()
-    
-    # Test smartphone detection
-    result = bluetooth_scanner.get_device_type("iPhone 15", mock_adv)
-    assert "Mobile Phone" in result or "📱" in result
-    
-    # Test headphones detection
-    result = bluetooth_scanner.get_device_type("AirPods Pro", mock_adv)
-    assert "Audio Device" in result or "🎧" in result
-    
-    # Test smartwatch detection  
-    result = bluetooth_scanner.get_device_type("Apple Watch", mock_adv)
-    assert "Wearable Device" in result or "⌚" in result
-    
-    # Test default case
-    result = bluetooth_scanner.get_device_type("Unknown Device", mock_adv)
-    assert "Bluetooth" in result or "🔵" in result
-    
-    print("✅ get_device_type tests passed!")
-
-def test_signal_strength_text():
+    result = _get_device_type(name, MockAdvData())
+    assert any(fragment in result for fragment in expected_fragments)
+
+
+@pytest.mark.parametrize("rssi,expected", [
+    (-30, "Very Strong"),
+    (-50, "Strong"),
+    (-70, "Medium"),
+    (-85, "Weak"),
+    (-95, "Very Weak"),
+], ids=["very-strong", "strong", "medium", "weak", "very-weak"])
+def test_signal_strength_text(rssi, expected):
     """Test signal strength categorization"""
-    print("Testing get_signal_strength_description...")
-    
-    # Test different signal levels
-    result = bluetooth_scanner.get_signal_strength_description(-30)
-    assert "Very Strong" in result or "Bardzo mocny" in result
-    
-    result = bluetooth_scanner.get_signal_strength_description(-50)
-    assert "Strong" in result or "Mocny" in result or "Strong" in result
-    
-    result = bluetooth_scanner.get_signal_strength_description(-70)
-    assert "Medium" in result or "Średni" in result
-    
-    result = bluetooth_scanner.get_signal_strength_description(-85)
-    assert "Weak" in result or "Słaby" in result
-    
-    result = bluetooth_scanner.get_signal_strength_description(-95)
-    assert "Very Weak" in result or "Bardzo słaby" in result
-    
-    print("✅ get_signal_strength_description tests passed!")
+    assert expected in _get_signal_strength(rssi)
+
 
 if __name__ == "__main__":
-    print("🧪 Running simple bluetooth scanner tests...")
-    print("=" * 50)
-    
-    try:
-        test_get_company_name()
-        test_get_device_type()
-        test_signal_strength_text()
-        
-        print("=" * 50)
-        print("🎉 All tests passed successfully!")
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -5,6 +5,7 @@ import pytest
 import asyncio
 import sys
 import os
+from types import SimpleNamespace
 
 # Add the parent directory to the path to import bluetooth_scanner
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,27 +17,39 @@ def event_loop():
     yield loop
     loop.close()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_device():
-    """Mock device for testing"""
-    class MockDevice:
-        def __init__(self, address="AA:BB:CC:DD:EE:FF", name="Test Device", rssi=-50):
-            self.address = address
-            self.name = name
-            self.rssi = rssi
-            
-        def __str__(self):
-            return f"{self.name} ({self.address})"
-    
-    return MockDevice
-
-@pytest.fixture
+    """Cached factory for lightweight mock devices"""
+    cache = {}
+
+    def make(address="AA:BB:CC:DD:EE:FF", name="Test Device", rssi=-50):
+        key = (address, name, rssi)
+        return cache.setdefault(key, SimpleNamespace(address=address, name=name, rssi=rssi))
+
+    return make
+
+@pytest.fixture(scope="session")
 def mock_advertisement_data():
-    """Mock advertisement data for testing"""
-    class MockAdvertisementData:
-        def __init__(self, local_name=None, manufacturer_data=None, service_data=None):
-            self.local_name = local_name
-            self.manufacturer_data = manufacturer_data or {}
-            self.service_data = service_data or {}
-            
-    return MockAdvertisementData
+    """Cached factory for lightweight mock advertisement data"""
+    cache = {}
+
+    def make(local_name=None, manufacturer_data=None, service_data=None,
+             service_uuids=None, rssi=-50):
+        key = (
+            local_name,
+            tuple(sorted(manufacturer_data.items())) if manufacturer_data else (),
+            tuple(sorted(service_data.items())) if service_data else (),
+            tuple(service_uuids) if service_uuids else (),
+            rssi,
+        )
+        if key not in cache:
+            cache[key] = SimpleNamespace(
+                local_name=local_name,
+                manufacturer_data=manufacturer_data or {},
+                service_data=service_data or {},
+                service_uuids=service_uuids or [],
+                rssi=rssi,
+            )
+        return cache[key]
+
+    return make
@@ -0,0 +1,109 @@
+"""
+Unit tests for bluetooth_scanner
+"""
+import pytest
+from collections import namedtuple
+from unittest.mock import patch
+
+import bluetooth_scanner
+
+# Slotted stand-ins for BLEDevice/AdvertisementData; scan_bluetooth_devices
+# only reads attributes, and namedtuples keep hundreds of simulated devices
+# cheap compared to mock objects
+Dev = namedtuple("Dev", "address name rssi")
+Adv = namedtuple("Adv", "local_name manufacturer_data")
+
+# Module-level aliases avoid per-call attribute lookups in hot tests
+_scan = bluetooth_scanner.scan_bluetooth_devices
+_get_device_types_batch = bluetooth_scanner.get_device_types_batch
+_generate_pdf_report = bluetooth_scanner.generate_pdf_report
+
+
+class StubScanner:
+    """Synchronous BleakScanner stand-in that reports one device on entry"""
+    __slots__ = ("_callback",)
+
+    devices = []
+
+    def __init__(self, detection_callback=None, service_uuids=None):
+        self._callback = detection_callback
+
+    async def __aenter__(self):
+        if self._callback:
+            for device, adv in self.devices:
+                self._callback(device, adv)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class TestScanning:
+    """Tests for the scan loop without a real Bluetooth adapter"""
+    __slots__ = ()
+
+    @pytest.mark.asyncio
+    async def test_scan_bluetooth_devices(self):
+        """Test that detected devices are collected and returned"""
+        device = Dev("AA:BB:CC:DD:EE:FF", "Test Device", -50)
+        adv = Adv("Test Device", {})
+        StubScanner.devices = [(device, adv)]
+
+        with patch("bluetooth_scanner.BleakScanner", StubScanner):
+            result = await _scan(duration=0, min_devices=1)
+
+        assert result == {device.address: (device, adv)}
+
+
+class TestUtilityFunctions:
+    """Tests for standalone helper functions"""
+    __slots__ = ()
+
+    def test_device_category_detection(self):
+        """Test batch classification of device names"""
+        categories = [
+            ("iPhone 15", "Mobile Phone"),
+            ("AirPods Pro", "Audio Device"),
+            ("Apple Watch", "Wearable Device"),
+            ("Unknown Device", "Bluetooth"),
+        ]
+        results = _get_device_types_batch([n for n, _ in categories])
+        assert all(exp in got for (_, exp), got in zip(categories, results))
+
+
+class TestPdfGeneration:
+    """Tests for PDF report generation without touching the filesystem"""
+    __slots__ = ()
+
+    @pytest.fixture(autouse=True, scope="class")
+    @staticmethod
+    def _frozen_datetime():
+        """Patch the report timestamp once for every test in the class"""
+        with patch("bluetooth_scanner.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "20250101_120000"
+            yield mock_datetime
+
+    @patch("bluetooth_scanner.SimpleDocTemplate")
+    def test_generate_pdf_report(self, mock_doc, mock_device, mock_advertisement_data):
+        """Test that a report is built for a scanned device without disk I/O"""
+        mock_doc.return_value.build.return_value = None
+        device = mock_device(name="iPhone 15", rssi=-45)
+        adv = mock_advertisement_data(manufacturer_data={76: b"\x01\x02"}, rssi=-45)
+        devices = {device.address: (device, adv)}
+
+        result = _generate_pdf_report(devices, "12:00:00", 10)
+
+        assert mock_doc.call_args[0][0].endswith(".pdf")
+        assert mock_doc.return_value.build.called
+        assert result.endswith(".pdf")
+
+    @patch("bluetooth_scanner.SimpleDocTemplate")
+    def test_empty_device_list(self, mock_doc):
+        """Test that an empty scan still produces a minimal report"""
+        mock_doc.return_value.build.return_value = None
+
+        result = _generate_pdf_report({}, "12:00:00", 10)
+
+        assert mock_doc.call_args[0][0].endswith(".pdf")
+        assert mock_doc.return_value.build.called
+        assert result.endswith(".pdf")